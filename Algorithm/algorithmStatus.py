@@ -5,7 +5,7 @@ Handles creation, updates, and tracking of algorithm execution status.
 
 import uuid
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from rider_data import RiderLite
 from supabase import Client
@@ -43,12 +43,32 @@ def get_or_create_algorithm_status(sb: Client, algorithm_name: str, target_scope
     Check for a scheduled algorithm run and return its id, or create a new one.
     Returns the status record id (uuid as string) or None if creation fails.
     """
+    status_id, _ = _claim_algorithm_status(sb, algorithm_name, target_scope, assign_run_id=False)
+    return status_id
+
+
+def claim_algorithm_status(sb: Client, algorithm_name: str, target_scope: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Same as get_or_create_algorithm_status, but also returns the record's run_id.
+    A scheduled row without a run_id gets one in the same write that marks it running,
+    so the caller does not need extra select/update round-trips.
+    Returns (status_id, run_id); both are None if creation fails.
+    """
+    return _claim_algorithm_status(sb, algorithm_name, target_scope, assign_run_id=True)
+
+
+def _claim_algorithm_status(
+    sb: Client,
+    algorithm_name: str,
+    target_scope: str,
+    assign_run_id: bool,
+) -> Tuple[Optional[str], Optional[str]]:
     now = datetime.now()
     
     # Check for scheduled runs (status = 'scheduled' and scheduled_for <= now)
     scheduled_resp = (
         sb.table("AlgorithmStatus")
-        .select("id")
+        .select("id,run_id")
         .eq("algorithm_name", algorithm_name)
         .eq("target", target_scope)
         .eq("status", "scheduled")
@@ -60,12 +80,17 @@ def get_or_create_algorithm_status(sb: Client, algorithm_name: str, target_scope
     
     if scheduled_resp.data and len(scheduled_resp.data) > 0:
         status_id = scheduled_resp.data[0]["id"]
+        run_id = scheduled_resp.data[0].get("run_id")
         # Update to 'running' status
-        sb.table("AlgorithmStatus").update({
+        update_data = {
             "status": "running",
             "started_at": now.isoformat()
-        }).eq("id", status_id).execute()
-        return status_id
+        }
+        if assign_run_id and not run_id:
+            run_id = str(uuid.uuid4())
+            update_data["run_id"] = run_id
+        sb.table("AlgorithmStatus").update(update_data).eq("id", status_id).execute()
+        return status_id, run_id
     
     # No scheduled run found, create a new one
     run_id = str(uuid.uuid4())
@@ -80,9 +105,9 @@ def get_or_create_algorithm_status(sb: Client, algorithm_name: str, target_scope
     
     resp = sb.table("AlgorithmStatus").insert(new_status).execute()
     if resp.data and len(resp.data) > 0:
-        return resp.data[0]["id"]
+        return resp.data[0]["id"], run_id
     
-    return None
+    return None, None
 
 
 def update_algorithm_status(
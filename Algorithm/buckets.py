@@ -1,15 +1,16 @@
 # buckets.py
 from collections import defaultdict
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 import config
 from rider_data import RiderLite
 
 
-# build a readable bucket label from direction + airport
-def _bucket_label(r: RiderLite, allowed_group: str) -> str:
-    direction = "TO" if r.to_airport else "FROM"
-    return f"{direction} {r.airport} | {allowed_group}"
+# build a readable bucket label from a (to_airport, airport, group) key
+def _bucket_label(key: Tuple[bool, str, str]) -> str:
+    to_airport, airport, allowed_group = key
+    direction = "TO" if to_airport else "FROM"
+    return f"{direction} {airport} | {allowed_group}"
 
 def _school_group_for(r: RiderLite) -> str:
     """
@@ -28,15 +29,13 @@ def _school_group_for(r: RiderLite) -> str:
     # Unrestricted → ALL schools match each other
     return "ALL"
 
-# group riders by airport + direction
+# group riders by airport + direction; labels are formatted once per bucket
 def make_buckets(riders: List[RiderLite]) -> Dict[str, List[RiderLite]]:
-    buckets: Dict[str, List[RiderLite]] = defaultdict(list)
+    buckets: Dict[Tuple[bool, str, str], List[RiderLite]] = defaultdict(list)
     for r in riders:
-        group_key = _school_group_for(r)
-        bucket_key = _bucket_label(r, group_key)
-        buckets[bucket_key].append(r)
+        buckets[(r.to_airport, r.airport, _school_group_for(r))].append(r)
 
-    return dict(buckets)
+    return {_bucket_label(key): members for key, members in buckets.items()}
 
 # optional: get a stable list of bucket names (sorted)
 def bucket_names(buckets: Dict[str, List[RiderLite]]) -> List[str]:
@@ -99,29 +99,32 @@ def determine_uber_type(group_size: int, bag_units: int) -> Optional[str]:
     return None
 
 
-def compute_group_time_window(riders: Sequence[RiderLite]) -> Tuple[str, str]:
+def compute_group_datetimes(matches: Sequence[Match]) -> List[Tuple[str, str, str, str]]:
     """
-    Compute the shared group window as time strings.
-
-    ``earliest_time`` is the latest rider start. ``latest_time`` is the
-    earliest rider end. Overnight windows are normalized so persisted group
-    windows agree with matching interval behavior.
+    Return ``(ride_date, ride_time, earliest_time, latest_time)`` for each match.
+
+    Each group's shared window is computed once and reused for both the
+    persisted date/time fallback and the group window fields, so writers can
+    call this once up front and index the result instead of re-parsing every
+    rider window per field. ``earliest_time`` is the latest rider start and
+    ``latest_time`` the earliest rider end; overnight windows are normalized
+    so persisted group windows agree with matching interval behavior.
     """
-    if not riders:
-        raise MatchingCommitError("Cannot compute a group time window without riders.")
-
-    latest_start, earliest_end = common_window(riders)
-    return time_string(latest_start), time_string(earliest_end)
-
-
-def match_datetime_from_earliest(m: Match) -> Tuple[str, str]:
-    """Official ride date/time for persistence."""
-    if m.suggested_time_iso:
-        dt = datetime.fromisoformat(m.suggested_time_iso)
-        return dt.date().isoformat(), dt.time().replace(microsecond=0).isoformat()
-
-    dt, _ = common_window(m.riders)
-    return dt.date().isoformat(), dt.time().replace(microsecond=0).isoformat()
+    out: List[Tuple[str, str, str, str]] = []
+    for m in matches:
+        if not m.riders:
+            raise MatchingCommitError("Cannot compute a group time window without riders.")
+        latest_start, earliest_end = common_window(m.riders)
+        dt = datetime.fromisoformat(m.suggested_time_iso) if m.suggested_time_iso else latest_start
+        out.append(
+            (
+                dt.date().isoformat(),
+                time_string(dt),
+                time_string(latest_start),
+                time_string(earliest_end),
+            )
+        )
+    return out
 
 
 def _bag_units(riders: Sequence[RiderLite]) -> int:
@@ -156,10 +159,11 @@ def build_matching_commit_payload(
     matched_ids = {int(r.flight_id) for m in matches for r in m.riders}
     unmatched_ids = sorted(considered_ids - matched_ids)
 
+    group_datetimes = compute_group_datetimes(matches)
     groups: List[Dict[str, Any]] = []
-    for m in matches:
-        ride_date, match_time = match_datetime_from_earliest(m)
-        group_earliest_time, group_latest_time = compute_group_time_window(m.riders)
+    for m, (ride_date, match_time, group_earliest_time, group_latest_time) in zip(
+        matches, group_datetimes
+    ):
         ride_type = getattr(m, "ride_type", None)
         group_size = len(m.riders)
         uber_type = ride_type or determine_uber_type(group_size, _bag_units(m.riders))
@@ -10,7 +10,7 @@ from __future__ import annotations
 from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
 
 import connect_policy as cp
-from rider_data import RiderLite, normalize_airport, normalize_matching_status
+from rider_data import RiderLite, _chunks, normalize_airport, normalize_matching_status
 from ruleMatching import Match, _group_to_match, _interval
 from supabase import Client
 from time_windows import common_window_or_none
@@ -44,7 +44,7 @@ def _common_window_riders(riders: Sequence[RiderLite]) -> Optional[Tuple[Any, An
 def _fetch_rides_in_range(sb: Client, start_date: str, end_date: str) -> Dict[int, Dict[str, Any]]:
     resp = (
         sb.table("Rides")
-        .select("*")
+        .select("ride_id,ride_type")
         .gte("ride_date", start_date)
         .lte("ride_date", end_date)
         .execute()
@@ -54,11 +54,8 @@ def _fetch_rides_in_range(sb: Client, start_date: str, end_date: str) -> Dict[in
 
 def _fetch_matches_for_rides(sb: Client, ride_ids: Sequence[int]) -> List[Dict[str, Any]]:
     out: List[Dict[str, Any]] = []
-    for i in range(0, len(ride_ids), 100):
-        chunk = list(ride_ids[i : i + 100])
-        if not chunk:
-            continue
-        resp = sb.table("Matches").select("*").in_("ride_id", chunk).execute()
+    for chunk in _chunks(ride_ids):
+        resp = sb.table("Matches").select("ride_id,flight_id").in_("ride_id", chunk).execute()
         out.extend(resp.data or [])
     return out
 
@@ -66,10 +63,7 @@ def _fetch_matches_for_rides(sb: Client, ride_ids: Sequence[int]) -> List[Dict[s
 def _fetch_flights(sb: Client, flight_ids: Sequence[int]) -> Dict[int, Dict[str, Any]]:
     out: Dict[int, Dict[str, Any]] = {}
     clean = sorted({int(fid) for fid in flight_ids})
-    for i in range(0, len(clean), 100):
-        chunk = clean[i : i + 100]
-        if not chunk:
-            continue
+    for chunk in _chunks(clean):
         resp = (
             sb.table("Flights")
             .select(
@@ -87,10 +81,7 @@ def _fetch_flights(sb: Client, flight_ids: Sequence[int]) -> Dict[int, Dict[str,
 def _fetch_users(sb: Client, user_ids: Sequence[str]) -> Dict[str, Dict[str, str]]:
     clean = sorted({uid for uid in user_ids if uid})
     out: Dict[str, Dict[str, str]] = {}
-    for i in range(0, len(clean), 100):
-        chunk = clean[i : i + 100]
-        if not chunk:
-            continue
+    for chunk in _chunks(clean):
         resp = sb.table("Users").select("user_id,school,firstname,lastname").in_("user_id", chunk).execute()
         for row in resp.data or []:
             name = f"{row.get('firstname') or ''} {row.get('lastname') or ''}".strip()
@@ -246,9 +237,9 @@ def _singletons_if_merge(
 ) -> List[RiderLite]:
     selected = {r.flight_id for r in group}
     touched = {
-        getattr(r, "source_ride_id", None)
+        r.source_ride_id
         for r in group
-        if getattr(r, "source_ride_id", None) is not None
+        if r.source_ride_id is not None
     }
     singletons: List[RiderLite] = []
     for ride_id in touched:
@@ -268,9 +259,9 @@ def _tag_source_ride_ids(
 ) -> None:
     for r in riders:
         if r.flight_id in new_match_ride_by_flight:
-            r.source_ride_id = new_match_ride_by_flight[r.flight_id]  # type: ignore[attr-defined]
+            r.source_ride_id = new_match_ride_by_flight[r.flight_id]
         elif r.flight_id in old_ride_by_flight:
-            r.source_ride_id = old_ride_by_flight[r.flight_id]  # type: ignore[attr-defined]
+            r.source_ride_id = old_ride_by_flight[r.flight_id]
 
 
 def _merge_pool(
@@ -286,7 +277,7 @@ def _merge_pool(
 
     matched_by_ride: Dict[int, List[RiderLite]] = {}
     for r in pool:
-        sid = getattr(r, "source_ride_id", None)
+        sid = r.source_ride_id
         if sid is not None:
             matched_by_ride.setdefault(int(sid), []).append(r)
 
@@ -372,7 +363,7 @@ def merge_connect_with_existing(
     by_source: Dict[int, List[RiderLite]] = {}
     still_unmatched: List[RiderLite] = []
     for r in leftover_riders:
-        sid = getattr(r, "source_ride_id", None)
+        sid = r.source_ride_id
         if sid is None:
             still_unmatched.append(r)
             continue
@@ -20,9 +20,8 @@ from buckets import make_buckets
 from commit_payload import (
     build_matching_commit_payload,
     commit_matching_run,
-    compute_group_time_window,
+    compute_group_datetimes,
     determine_uber_type,
-    match_datetime_from_earliest,
 )
 from dotenv import load_dotenv
 from rider_data import RiderData, RiderLite
@@ -41,36 +40,32 @@ SUPABASE_KEY = os.getenv("SUPABASE_SECRET_KEY")
 # Initialize Supabase client and location cache
 supabase = create_client(SUPABASE_URL, SUPABASE_KEY)
 
-# write matches to csv (one row per rider, grouped by a simulated ride_id; uses earliest-overlap date/time)
-def _write_matches_csv(
-    matches: List[Match], 
-    all_riders: List[RiderLite], 
-    csv_path: str,
-) -> None:
-    """
-    Write matches to a CSV (one row per matched ride group).
-    Also prints how many flights were matched vs unmatched.
-    """
-
-    if not matches:
-        print("No matches to write.")
-        return
-
-    rows = []
-    for idx, m in enumerate(matches, start=1):
-        sim_ride_id = idx
+# column order for the dry-run matches CSV (rows are written as plain tuples in this order)
+MATCHES_CSV_FIELDS = (
+    "ride_id_simulated",
+    "bucket_key",
+    "date",
+    "num_riders",
+    "suggested_time",
+    "earliest_time",
+    "latest_time",
+    "match_times",
+    "considered_bags",
+    "bags_total",
+    "num_large_bags",
+    "num_normal_bags",
+    "num_personal_bags",
+    "riders",
+    "voucher",
+    "contingency_vouchers",
+    "subsidized",
+    "uber_type",
+)
 
-        match_date, _ = match_datetime_from_earliest(m)
-        earliest_time, latest_time = compute_group_time_window(m.riders)
-
-        suggested_time_iso = m.suggested_time_iso or ""
-        try:
-            suggested_time = (
-                datetime.fromisoformat(suggested_time_iso).time().replace(microsecond=0).isoformat()
-                if suggested_time_iso else ""
-            )
-        except Exception:
-            suggested_time = ""
+# yield one csv row per match in MATCHES_CSV_FIELDS order, numbering rides as they stream out
+def _iter_match_rows(ordered: List[Tuple[Match, Tuple[str, str, str, str]]]):
+    for sim_ride_id, (m, (match_date, match_time, earliest_time, latest_time)) in enumerate(ordered, start=1):
+        suggested_time = match_time if m.suggested_time_iso else ""
 
         # rider details
         rider_names = [r.name or r.user_id for r in m.riders]
@@ -100,42 +95,57 @@ def _write_matches_csv(
         group_size = len(m.riders)
         uber_type = getattr(m, "ride_type", None) or determine_uber_type(group_size, considered_bags)
 
-        rows.append({
-            "ride_id_simulated": sim_ride_id,
-            "bucket_key": m.bucket_key or "",
-            "date": match_date,
-            "num_riders": group_size,
-            "suggested_time": suggested_time,
-            "earliest_time": earliest_time,
-            "latest_time": latest_time,
-            "match_times": match_times,
-            "considered_bags": considered_bags,
-            
-            "bags_total": bags_total,
-            "num_large_bags": num_large_bags,
-            "num_normal_bags": num_normal_bags,
-            "num_personal_bags": num_personal_bags,
-            "riders": json.dumps(rider_names),
-            "voucher": m.group_voucher,
-            "contingency_vouchers": json.dumps([getattr(r, "contingency_voucher", "") for r in m.riders]),
-            "subsidized": getattr(m, "group_subsidy", False),
-            "uber_type": uber_type
-        })
+        yield (
+            sim_ride_id,
+            m.bucket_key or "",
+            match_date,
+            group_size,
+            suggested_time,
+            earliest_time,
+            latest_time,
+            match_times,
+            considered_bags,
+            bags_total,
+            num_large_bags,
+            num_normal_bags,
+            num_personal_bags,
+            json.dumps(rider_names),
+            m.group_voucher,
+            json.dumps([r.contingency_voucher for r in m.riders]),
+            getattr(m, "group_subsidy", False),
+            uber_type,
+        )
 
-    rows.sort(key=lambda row: (
-        row.get("date") or "",
-        row.get("suggested_time") or row.get("earliest_time") or "",
-        row.get("bucket_key") or "",
-    ))
-    for idx, row in enumerate(rows, start=1):
-        row["ride_id_simulated"] = idx
 
-    fieldnames = list(rows[0].keys())
-    
-    with open(csv_path, "w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
+# write matches to csv (one row per rider, grouped by a simulated ride_id; uses earliest-overlap date/time)
+def _write_matches_csv(
+    matches: List[Match], 
+    all_riders: List[RiderLite], 
+    csv_path: str,
+) -> None:
+    """
+    Write matches to a CSV (one row per matched ride group).
+    Also prints how many flights were matched vs unmatched.
+    """
+
+    if not matches:
+        print("No matches to write.")
+        return
+
+    # sort by date, then pickup time (or window start), then bucket
+    ordered = sorted(
+        zip(matches, compute_group_datetimes(matches)),
+        key=lambda pair: (
+            pair[1][0] or "",
+            (pair[1][1] if pair[0].suggested_time_iso else "") or pair[1][2] or "",
+            pair[0].bucket_key or "",
+        ),
+    )
+
+    with open(csv_path, "w", newline="", buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(MATCHES_CSV_FIELDS)
+        writer.writerows(_iter_match_rows(ordered))
 
     print(f"Matches CSV saved to: {csv_path}")
 
@@ -150,7 +160,7 @@ def _write_matches_csv(
     unmatched_ids = list(considered_ids - matched_ids)
 
     print(
-        f"Wrote dry-run CSV with {len(rows)} matched groups → {csv_path}\n"
+        f"Wrote dry-run CSV with {len(matches)} matched groups → {csv_path}\n"
         f"Matched flights: {len(matched_ids)} | Unmatched flights: {len(unmatched_ids)}"
     )
 
@@ -340,25 +350,12 @@ def run(
         if not dry_run:
             target_scope = algorithmStatus.determine_target_scope(riders)
             
-            # Get or create algorithm status record
-            status_id = algorithmStatus.get_or_create_algorithm_status(supabase, algorithm_name, target_scope)
-            
-            # Get run_id from the status record if it exists
-            if status_id:
-                status_resp = (
-                    supabase.table("AlgorithmStatus")
-                    .select("run_id")
-                    .eq("id", status_id)
-                    .execute()
-                )
-                if status_resp.data and len(status_resp.data) > 0:
-                    run_id = status_resp.data[0].get("run_id")
+            # Get or create algorithm status record (with its run_id, assigned in the same write)
+            status_id, run_id = algorithmStatus.claim_algorithm_status(supabase, algorithm_name, target_scope)
             
-            # Generate run_id if not already set
+            # No status record could be created: still run under a fresh run_id
             if not run_id:
                 run_id = str(uuid.uuid4())
-                if status_id:
-                    supabase.table("AlgorithmStatus").update({"run_id": run_id}).eq("id", status_id).execute()
 
         # Print how many rider forms were loaded + the date range
         if riders:
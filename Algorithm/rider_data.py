@@ -1,13 +1,21 @@
 # this class is in charge of getting the neccessary data from our supabase database
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Sequence
 
 from supabase import Client
 
 
+# terminal patterns, compiled once at import
+_TERMINAL_NUMBER_RE = re.compile(r"\b\d+\b")
+_TERMINAL_LETTER_RE = re.compile(r"[A-Z]")
+
+
 # normalize terminal strings (strip, uppercase, map common patterns)
+# (memoized: only a few dozen distinct raw values show up across all flights)
+@lru_cache(maxsize=1024)
 def normalize_terminal(raw: Optional[str]) -> str:
     if not raw:
         return "UNKNOWN"
@@ -15,12 +23,12 @@ def normalize_terminal(raw: Optional[str]) -> str:
     term = str(raw).strip().upper()
 
     # numeric terminal (e.g., "1", "Terminal 2")
-    m = re.search(r"\b\d+\b", term)
+    m = _TERMINAL_NUMBER_RE.search(term)
     if m:
         return m.group(0)
 
     # single letter terminal (A, B, C…)
-    if re.fullmatch(r"[A-Z]", term):
+    if _TERMINAL_LETTER_RE.fullmatch(term):
         return term
 
     # international-style terminals
@@ -31,6 +39,7 @@ def normalize_terminal(raw: Optional[str]) -> str:
 
 
 # normalize airport names to IATA codes when possible
+@lru_cache(maxsize=1024)
 def normalize_airport(raw: Optional[str]) -> str:
     if not raw:
         return "UNKNOWN"
@@ -46,8 +55,8 @@ def normalize_matching_status(raw: Optional[str]) -> str:
     return "submitted"
 
 
-# row shape used by buckets/matching
-@dataclass
+# row shape used by buckets/matching (slotted: one of these per flight in every pass)
+@dataclass(slots=True)
 class RiderLite:
     user_id: str
     flight_id: int
@@ -66,6 +75,22 @@ class RiderLite:
     name: Optional[str] = None
     airline_iata: Optional[str] = None
     subsidized: bool = False
+    # set later in the pipeline (voucher assignment, Connect merge); not part of equality
+    group_voucher: Optional[str] = field(default=None, compare=False)
+    contingency_voucher: Optional[str] = field(default=None, compare=False)
+    source_ride_id: Optional[int] = field(default=None, compare=False)
+
+# PostgREST caps responses (1000 rows by default); page Flights reads at that size
+FLIGHTS_PAGE_SIZE = 1000
+
+# keep .in_() filters small enough for the PostgREST query string
+IN_FILTER_CHUNK_SIZE = 100
+
+
+def _chunks(values: Sequence[Any], size: int = IN_FILTER_CHUNK_SIZE) -> Iterator[List[Any]]:
+    for i in range(0, len(values), size):
+        yield list(values[i : i + size])
+
 
 class RiderData:
     # minimal fetch layer for flights + users → RiderLite objects
@@ -86,47 +111,62 @@ class RiderData:
                 f"min_days_ahead ({min_days_ahead}) cannot exceed max_days_ahead ({max_days_ahead})"
             )
 
-        q = (
-            self.sb.table("Flights")
-            .select(
-                "flight_id,user_id,flight_no,airline_iata,earliest_time,latest_time,"
-                "airport,date,to_airport,terminal,matching_status,bag_no,bag_no_large,bag_no_personal"
-            )
-            .order("date", desc=False)
-            .order("earliest_time", desc=False)
-        )
         if min_days_ahead is None:
-            q = q.gt("date", today.isoformat())
+            start_date = None
         else:
             start_date = (today + timedelta(days=min_days_ahead)).isoformat()
-            q = q.gte("date", start_date)
-
+        end_date = None
         if max_days_ahead is not None:
             end_date = (today + timedelta(days=max_days_ahead)).isoformat()
-            q = q.lte("date", end_date)
 
-        resp = q.execute()
         rows = []
-        for row in resp.data or []:
-            # The main pipeline only processes flights that have not already been matched.
-            if normalize_matching_status(row.get("matching_status")) == "matched":
-                continue
-            rows.append(row)
-        return rows
+        offset = 0
+        while True:
+            # the builder mutates in place, so each page gets a fresh query
+            q = (
+                self.sb.table("Flights")
+                .select(
+                    "flight_id,user_id,flight_no,airline_iata,earliest_time,latest_time,"
+                    "airport,date,to_airport,terminal,matching_status,bag_no,bag_no_large,bag_no_personal"
+                )
+                .order("date", desc=False)
+                .order("earliest_time", desc=False)
+                .order("flight_id", desc=False)
+            )
+            if start_date is None:
+                q = q.gt("date", today.isoformat())
+            else:
+                q = q.gte("date", start_date)
+            if end_date is not None:
+                q = q.lte("date", end_date)
+
+            page = q.range(offset, offset + FLIGHTS_PAGE_SIZE - 1).execute().data or []
+            for row in page:
+                # The main pipeline only processes flights that have not already been matched.
+                if normalize_matching_status(row.get("matching_status")) == "matched":
+                    continue
+                rows.append(row)
+            if len(page) < FLIGHTS_PAGE_SIZE:
+                return rows
+            offset += FLIGHTS_PAGE_SIZE
 
 
     # fetch school and name info for given user_ids
     def fetch_users(self, user_ids: List[str]) -> Dict[str, Dict[str, str]]:
         if not user_ids:
             return {}
-        resp = (
-            self.sb.table("Users")
-            .select("user_id,school,firstname,lastname")
-            .in_("user_id", list(set(uid for uid in user_ids if uid)))
-            .execute()
-        )
+        rows: List[Dict] = []
+        # one .in_() over every user would hit the same row cap (and URL length) as Flights
+        for chunk in _chunks(sorted(set(uid for uid in user_ids if uid))):
+            resp = (
+                self.sb.table("Users")
+                .select("user_id,school,firstname,lastname")
+                .in_("user_id", chunk)
+                .execute()
+            )
+            rows.extend(resp.data or [])
         result = {}
-        for row in (resp.data or []):
+        for row in rows:
             if not row.get("school"):
                 continue
             # Concatenate firstname and lastname, handling None values
@@ -62,13 +62,7 @@ def _are_same_flight(members: List[RiderLite]) -> bool:
 
 def _effective_overlap_minutes(members: List[RiderLite]) -> int:
     # compute overlap across all members with grace
-    starts, ends = [], []
-    for m in members:
-        s, e = _interval(m)
-        starts.append(s)
-        ends.append(e)
-    latest_start = max(starts)
-    earliest_end = min(ends)
+    latest_start, earliest_end = common_window(members)
     overlap_min = (earliest_end - latest_start).total_seconds() / 60.0
     if overlap_min >= 0:
         return int(overlap_min)  # actual overlap
@@ -79,6 +73,13 @@ def _effective_overlap_minutes(members: List[RiderLite]) -> int:
     return -1  # signals no feasible overlap even with grace
 
 
+# smallest window overlap that still counts as feasible (negative = gap allowed by grace)
+def _min_overlap() -> timedelta:
+    if config.ALLOW_TOUCHING:
+        return timedelta(minutes=-config.OVERLAP_GRACE_MIN)
+    return timedelta(0)
+
+
 # count bags for a rider (None → 0)
 def _bags_for(r: RiderLite) -> Tuple[int, int, int]:
     large = int(r.bags_no_large or 0)
@@ -105,6 +106,14 @@ def _bags_totals(members: List[RiderLite]) -> Tuple[int, int, int, int]:
     return total_large, total_normal, total_personal, total_all
 
 
+# True when every member shares one terminal (missing terminal counts as "")
+def _same_terminal(members: List[RiderLite]) -> bool:
+    if not members:
+        return True
+    first = members[0].terminal or ""
+    return all((m.terminal or "") == first for m in members)
+
+
 # When True, final-pass rules allow groups of 3 with max 12 bags (Uber XXL) and relaxed large-bag limit
 _final_pass_group3_rules = False
 
@@ -141,10 +150,8 @@ def _is_valid_group(members: List[RiderLite]) -> bool:
             if total_all > config.MAX_TOTAL_BAGS:  # Groups of 2 or 4 can have <= 10
                 return False
 
-    if config.TERMINAL_MODE == "strict":
-        terms = [m.terminal or "" for m in members]
-        if len(set(terms)) > 1:
-            return False
+    if config.TERMINAL_MODE == "strict" and not _same_terminal(members):
+        return False
 
     return True
 
@@ -325,11 +332,9 @@ def _split_full_group_for_leftovers(
 
 # terminal mismatch penalty (used only in relaxed mode)
 def _terminal_penalty(members: List[RiderLite]) -> float:
-    terms = [m.terminal or "" for m in members]
-    same = len(set(terms)) <= 1
     if config.TERMINAL_MODE == "strict":
         return 0.0
-    return 0.0 if same else 0.5
+    return 0.0 if _same_terminal(members) else 0.5
 
 
 # score any group: higher is better
@@ -390,13 +395,29 @@ def _score_group(members: List[RiderLite], validate: bool = False) -> float:
 # build and score all feasible pairs within a bucket
 def _build_scored_pairs(riders: List[RiderLite]) -> List[Tuple[int, int, float]]:
     pairs: List[Tuple[int, int, float]] = []
-    n = len(riders)
-    for i in range(n):
-        for j in range(i + 1, n):
-            score = _score_group([riders[i], riders[j]], validate=True)
-            if score != float("-inf"):
-                pairs.append((i, j, score))
-    pairs.sort(key=lambda t: t[2], reverse=True)
+    # strict terminals: cross-terminal pairs are always invalid, so only pair within a terminal
+    if config.TERMINAL_MODE == "strict":
+        by_terminal: Dict[str, List[int]] = {}
+        for idx, r in enumerate(riders):
+            by_terminal.setdefault(r.terminal or "", []).append(idx)
+        index_groups = list(by_terminal.values())
+    else:
+        index_groups = [list(range(len(riders)))]
+    # windows that cannot overlap fail validation anyway; skip them before full scoring
+    intervals = [_interval(r) for r in riders]
+    min_overlap = _min_overlap()
+    for idxs in index_groups:
+        for a, i in enumerate(idxs):
+            start_i, end_i = intervals[i]
+            for j in idxs[a + 1:]:
+                start_j, end_j = intervals[j]
+                if min(end_i, end_j) - max(start_i, start_j) < min_overlap:
+                    continue
+                score = _score_group([riders[i], riders[j]], validate=True)
+                if score != float("-inf"):
+                    pairs.append((i, j, score))
+    # best score first; ties keep (i, j) order, as with a single pass over all pairs
+    pairs.sort(key=lambda t: (-t[2], t[0], t[1]))
     return pairs
 
 
@@ -418,21 +439,29 @@ def _expand_group(seed: List[RiderLite], candidates: List[RiderLite], matched_fl
     if matched_flight_ids is None:
         matched_flight_ids = set()
     # Track flight_ids already in the seed group
+    # (this also covers members themselves, so no separate `c in group` scan is needed)
     seed_flight_ids = {r.flight_id for r in seed}
     group = list(seed)
+    min_overlap = _min_overlap()
+    # running group window; a candidate whose window misses it can only score -inf
+    group_start, group_end = common_window(group)
+    # strict terminals: only candidates at the seed's terminal can ever be valid
+    strict_terminal = (group[0].terminal or "") if config.TERMINAL_MODE == "strict" else None
     while len(group) < config.MAX_GROUP_SIZE:
         best = None
         best_score = float("-inf")
         for c in candidates:
-            # Skip if already in group (by object identity)
-            if c in group:
-                continue
             # Skip if flight_id already matched elsewhere
             if c.flight_id in matched_flight_ids:
                 continue
             # Skip if flight_id already in this group
             if c.flight_id in seed_flight_ids:
                 continue
+            if strict_terminal is not None and (c.terminal or "") != strict_terminal:
+                continue
+            c_start, c_end = _interval(c)
+            if min(group_end, c_end) - max(group_start, c_start) < min_overlap:
+                continue
             trial = group + [c]
             score = _score_group(trial, validate=True)
             if score > best_score:
@@ -442,6 +471,9 @@ def _expand_group(seed: List[RiderLite], candidates: List[RiderLite], matched_fl
             break
         group.append(best)
         seed_flight_ids.add(best.flight_id)
+        best_start, best_end = _interval(best)
+        group_start = max(group_start, best_start)
+        group_end = min(group_end, best_end)
     return group
 
 
@@ -514,6 +546,12 @@ def _promote_lax_twos(matches: List[Match], bucket_key: Optional[str]) -> List[M
         if len(ms) <= 1:
             continue
 
+        # flight_id -> matches containing it (O(1) lookup instead of rescanning every match per donor rider)
+        matches_by_flight: Dict[int, List[Match]] = {}
+        for m in ms:
+            for r in m.riders:
+                matches_by_flight.setdefault(r.flight_id, []).append(m)
+
         for m2 in twos:
             A, B = m2.riders  # the two riders to promote
             # search donor groups
@@ -546,8 +584,8 @@ def _promote_lax_twos(matches: List[Match], bucket_key: Optional[str]) -> List[M
                     # the only potential conflict is if X.flight_id is already in another match
                     # But we're only moving within the same date's matches, so this should be safe
                     # However, let's be explicit: X should not be in any other match
-                    x_in_other = any(X.flight_id in {r.flight_id for r in m.riders} 
-                                    for m in ms if m is not m2 and m is not donor)
+                    x_in_other = any(m is not m2 and m is not donor
+                                     for m in matches_by_flight.get(X.flight_id, []))
                     if x_in_other:
                         continue  # X is already in another match, skip
 
@@ -565,6 +603,10 @@ def _promote_lax_twos(matches: List[Match], bucket_key: Optional[str]) -> List[M
                     donor.suggested_time_iso = rebuilt_donor.suggested_time_iso
                     donor.terminal = rebuilt_donor.terminal
 
+                    # X now lives in m2 instead of donor
+                    x_matches = matches_by_flight[X.flight_id]
+                    x_matches[:] = [m for m in x_matches if m is not donor] + [m2]
+
                     # only perform ONE successful upgrade per 2-group
                     break
 
@@ -806,14 +848,7 @@ def pickup_datetime_for_group(group: List[RiderLite]) -> datetime:
     if not group:
         return datetime.now().replace(second=0, microsecond=0)
 
-    starts, ends = [], []
-    for g in group:
-        s, e = _interval(g)
-        starts.append(s)
-        ends.append(e)
-
-    latest_start = max(starts)
-    earliest_end = min(ends)
+    latest_start, earliest_end = common_window(group)
     to_airport = group[0].to_airport
 
     if earliest_end <= latest_start:
@@ -854,8 +889,7 @@ def _group_to_match(group: List[RiderLite], bucket_key: Optional[str] = None) ->
     chosen = pickup_datetime_for_group(group)
 
     # Terminal handling (strict mode)
-    terms = [g.terminal or "" for g in group]
-    terminal = terms[0] if len(set(terms)) == 1 else None
+    terminal = (group[0].terminal or "") if group and _same_terminal(group) else None
 
     return Match(
         riders=group,
@@ -902,27 +936,6 @@ def _ont_post_process_unmatched(
         """Compute the time window for a group (earliest start, latest end)."""
         return common_window(riders)
     
-    # Group unmatched by date
-    unmatched_by_date: Dict[str, List[RiderLite]] = {}
-    for u in ont_unmatched:
-        unmatched_by_date.setdefault(u.date, []).append(u)
-    
-    # Group matches by date and filter for ONT groups of 4
-    # Pre-compute time windows for each group of 4 for efficient filtering
-    matches_by_date: Dict[str, List[Tuple[Match, Tuple[datetime, datetime]]]] = {}
-    for m in matches:
-        if not m.riders:
-            continue
-        # Only process ONT matches
-        if (m.riders[0].airport or "").upper() != "ONT":
-            continue
-        # Only groups of 4
-        if len(m.riders) != 4:
-            continue
-        date = m.riders[0].date
-        group_window = _group_time_window(m.riders)
-        matches_by_date.setdefault(date, []).append((m, group_window))
-    
     # Work on copies
     ms = list(matches)
     remaining_unmatched = list(unmatched)
@@ -932,9 +945,10 @@ def _ont_post_process_unmatched(
     while changed:
         changed = False
         
-        # Rebuild matches_by_date on each iteration (in case matches changed)
-        matches_by_date: Dict[str, List[Tuple[Match, Tuple[datetime, datetime]]]] = {}
-        for m in ms:
+        # Rebuild matches_by_date on each iteration (in case matches changed);
+        # entries carry their position in ms so a split can replace them in place
+        matches_by_date: Dict[str, List[Tuple[int, Match, Tuple[datetime, datetime]]]] = {}
+        for mi, m in enumerate(ms):
             if not m.riders:
                 continue
             # Only process ONT matches
@@ -945,7 +959,7 @@ def _ont_post_process_unmatched(
                 continue
             date = m.riders[0].date
             group_window = _group_time_window(m.riders)
-            matches_by_date.setdefault(date, []).append((m, group_window))
+            matches_by_date.setdefault(date, []).append((mi, m, group_window))
         
         # Rebuild unmatched_by_date (filter to only ONT and not yet matched)
         unmatched_by_date: Dict[str, List[RiderLite]] = {}
@@ -972,7 +986,7 @@ def _ont_post_process_unmatched(
                 u_start, u_end = _interval(unmatched_rider)
                 
                 # Try each group of 4 on this date
-                for match_4, (group_start, group_end) in date_matches_with_windows:
+                for ms_idx, match_4, (group_start, group_end) in date_matches_with_windows:
                     if len(match_4.riders) != 4:
                         continue
                     
@@ -1015,22 +1029,15 @@ def _ont_post_process_unmatched(
                         # group_subsidy / vouchers: main.run applies after all post-processing
                         
                         # Replace the 4-person group with the 3-person group in ms
-                        try:
-                            ms_idx = ms.index(match_4)
-                            ms[ms_idx] = match_3
-                        except ValueError:
-                            # Match not found (shouldn't happen, but handle gracefully)
-                            continue
-                        
+                        ms[ms_idx] = match_3
                         ms.append(match_2)
                         
                         # Update matched_flight_ids
                         matched_flight_ids.add(unmatched_rider.flight_id)
                         matched_flight_ids.add(X.flight_id)
                         
-                        # Remove from remaining_unmatched
-                        if unmatched_rider in remaining_unmatched:
-                            remaining_unmatched.remove(unmatched_rider)
+                        # Remove from remaining_unmatched (by identity, not field equality)
+                        remaining_unmatched = [u for u in remaining_unmatched if u is not unmatched_rider]
                         
                         changed = True
                         break  # Stop trying other X in this group
@@ -1125,10 +1132,8 @@ def _final_leftovers(
                     continue
             
             # Check terminal if in strict mode
-            if config.TERMINAL_MODE == "strict":
-                terms = [m.terminal or "" for m in trial]
-                if len(set(terms)) > 1:
-                    continue
+            if config.TERMINAL_MODE == "strict" and not _same_terminal(trial):
+                continue
             
             # This group can accept the leftover
             best_match_idx = mi
@@ -1218,16 +1223,16 @@ def _form_connect_shuttle_groups(
     Returns (list of Connect matches, remaining riders who didn't fit).
     """
     matches: List[Match] = []
-    remaining = list(pool)
+    # walk the pool with an offset instead of re-slicing the tail after every group
+    start, n = 0, len(pool)
     for lo, hi in cp.connect_tiers():
-        while len(remaining) >= lo:
-            take = min(len(remaining), hi)
-            group = remaining[:take]
-            remaining = remaining[take:]
-            m = _group_to_match(group, bucket_key=bucket_key)
+        while n - start >= lo:
+            take = min(n - start, hi)
+            m = _group_to_match(pool[start:start + take], bucket_key=bucket_key)
             m.ride_type = "Connect"
             matches.append(m)
-    return matches, remaining
+            start += take
+    return matches, list(pool[start:])
 
 
 def _try_lax_connect_shuttles(
@@ -7,33 +7,55 @@ and the end belongs to the following calendar day.
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
 from typing import Optional, Sequence, Tuple
 
 from rider_data import RiderLite
 
 
-def rider_interval(rider: RiderLite) -> Tuple[datetime, datetime]:
-    """Return a rider's normalized start/end datetimes."""
-    start = datetime.fromisoformat(f"{rider.date}T{rider.earliest_time}")
-    end = datetime.fromisoformat(f"{rider.date}T{rider.latest_time}")
+# riders share a handful of dates and times, so parsed values are memoized
+@lru_cache(maxsize=4096)
+def _parse_date(value: str) -> date:
+    return date.fromisoformat(value)
+
+
+@lru_cache(maxsize=4096)
+def _parse_time(value: str) -> time:
+    return time.fromisoformat(value)
+
+
+# matching re-reads the same rider windows many times per bucket (pairs, expansion,
+# scoring), so whole intervals are memoized on their raw field values
+@lru_cache(maxsize=16384)
+def _window(day_text: str, earliest_text: str, latest_text: str) -> Tuple[datetime, datetime]:
+    day = _parse_date(day_text)
+    start = datetime.combine(day, _parse_time(earliest_text))
+    end = datetime.combine(day, _parse_time(latest_text))
     if end < start:
         end += timedelta(days=1)
     return start, end
 
 
+def rider_interval(rider: RiderLite) -> Tuple[datetime, datetime]:
+    """Return a rider's normalized start/end datetimes."""
+    return _window(str(rider.date), str(rider.earliest_time), str(rider.latest_time))
+
+
 def common_window(riders: Sequence[RiderLite]) -> Tuple[datetime, datetime]:
     """Return the shared group window as normalized datetimes."""
     if not riders:
         raise ValueError("Cannot compute a common time window without riders.")
 
-    starts, ends = [], []
-    for rider in riders:
+    latest_start, earliest_end = rider_interval(riders[0])
+    for rider in riders[1:]:
         start, end = rider_interval(rider)
-        starts.append(start)
-        ends.append(end)
+        if start > latest_start:
+            latest_start = start
+        if end < earliest_end:
+            earliest_end = end
 
-    return max(starts), min(ends)
+    return latest_start, earliest_end
 
 
 def common_window_or_none(
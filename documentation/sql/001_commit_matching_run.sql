@@ -47,10 +47,12 @@ set search_path = public
 as $$
 declare
   group_item jsonb;
-  member_item jsonb;
+  v_member jsonb;
   v_ride_id int8;
   v_group_count integer := 0;
   v_match_count integer := 0;
+  v_group_match_count integer;
+  v_contingency_links jsonb;
   v_cleanup_flight_ids int8[] := array[]::int8[];
   v_cleanup_ride_ids int8[] := array[]::int8[];
   v_matched_flight_ids int8[] := array[]::int8[];
@@ -202,14 +204,19 @@ begin
       v_group_vouchers_used := v_group_vouchers_used + 1;
     end if;
 
-    for member_item in
-      select value
-      from jsonb_array_elements(group_item->'members')
-    loop
-      v_contingency_voucher_id := null;
-      v_contingency_voucher_link := null;
+    -- Contingency vouchers are claimed per member; every other member field
+    -- comes straight from the payload, so the group's Matches rows are written
+    -- with one set-based insert below.
+    v_contingency_links := '{}'::jsonb;
+
+    if v_group_is_subsidized and not v_group_is_connect and not v_group_to_airport then
+      for v_member in
+        select value
+        from jsonb_array_elements(group_item->'members')
+      loop
+        v_contingency_voucher_id := null;
+        v_contingency_voucher_link := null;
 
-      if v_group_is_subsidized and not v_group_is_connect and not v_group_to_airport then
         select voucher_id, voucher_link
         into v_contingency_voucher_id, v_contingency_voucher_link
         from public."Vouchers"
@@ -228,7 +235,7 @@ begin
             'No available contingency voucher for airport %, direction from_airport, ride date %, flight %',
             v_group_airport,
             v_ride_date,
-            member_item->>'flight_id';
+            v_member->>'flight_id';
         end if;
 
         update public."Vouchers"
@@ -236,49 +243,57 @@ begin
             used_at = now(),
             used_by_run_id = p_run_id,
             assigned_ride_id = v_ride_id,
-            assigned_flight_id = (member_item->>'flight_id')::int8,
+            assigned_flight_id = (v_member->>'flight_id')::int8,
             updated_at = now()
         where voucher_id = v_contingency_voucher_id;
 
+        v_contingency_links := v_contingency_links
+          || jsonb_build_object(v_member->>'flight_id', v_contingency_voucher_link);
         v_contingency_vouchers_used := v_contingency_vouchers_used + 1;
-      end if;
+      end loop;
+    end if;
 
-      insert into public."Matches" (
-        ride_id,
-        user_id,
-        flight_id,
-        date,
-        time,
-        earliest_time,
-        latest_time,
-        source,
-        voucher,
-        contingency_voucher,
-        is_verified,
-        is_subsidized,
-        uber_type
-      )
-      values (
-        v_ride_id,
-        (member_item->>'user_id')::uuid,
-        (member_item->>'flight_id')::int8,
-        (member_item->>'date')::date,
-        (member_item->>'time')::time,
-        (member_item->>'earliest_time')::time,
-        (member_item->>'latest_time')::time,
-        member_item->>'source',
-        v_group_voucher_link,
-        v_contingency_voucher_link,
-        coalesce((member_item->>'is_verified')::boolean, false),
-        v_group_is_subsidized,
-        nullif(member_item->>'uber_type', '')
-      );
-
-      v_match_count := v_match_count + 1;
-      v_matched_flight_ids := array_append(v_matched_flight_ids, (member_item->>'flight_id')::int8);
-    end loop;
+    insert into public."Matches" (
+      ride_id,
+      user_id,
+      flight_id,
+      date,
+      time,
+      earliest_time,
+      latest_time,
+      source,
+      voucher,
+      contingency_voucher,
+      is_verified,
+      is_subsidized,
+      uber_type
+    )
+    select
+      v_ride_id,
+      (member_item->>'user_id')::uuid,
+      (member_item->>'flight_id')::int8,
+      (member_item->>'date')::date,
+      (member_item->>'time')::time,
+      (member_item->>'earliest_time')::time,
+      (member_item->>'latest_time')::time,
+      member_item->>'source',
+      v_group_voucher_link,
+      v_contingency_links->>(member_item->>'flight_id'),
+      coalesce((member_item->>'is_verified')::boolean, false),
+      v_group_is_subsidized,
+      nullif(member_item->>'uber_type', '')
+    from jsonb_array_elements(group_item->'members') as members(member_item);
+
+    get diagnostics v_group_match_count = row_count;
+    v_match_count := v_match_count + v_group_match_count;
   end loop;
 
+  -- Collect every matched flight once so Flights is updated in one statement.
+  select coalesce(array_agg((member_item->>'flight_id')::int8), array[]::int8[])
+  into v_matched_flight_ids
+  from jsonb_array_elements(coalesce(p_payload->'groups', '[]'::jsonb)) as groups(group_value)
+  cross join lateral jsonb_array_elements(group_value->'members') as members(member_item);
+
   if cardinality(v_matched_flight_ids) > 0 then
     update public."Flights"
     set matching_status = 'matched',
@@ -0,0 +1,94 @@
+"""Tests for AlgorithmStatus claiming in algorithmStatus.py."""
+
+import unittest
+from types import SimpleNamespace
+
+import algorithmStatus
+
+
+class _FakeStatusTable:
+    def __init__(self, parent):
+        self.parent = parent
+        self._update = None
+
+    def select(self, _columns):
+        return self
+
+    def eq(self, _column, _value):
+        return self
+
+    def lte(self, _column, _value):
+        return self
+
+    def order(self, _column, desc=False):
+        return self
+
+    def limit(self, _count):
+        return self
+
+    def update(self, data):
+        self._update = data
+        return self
+
+    def insert(self, row):
+        self.parent.inserts.append(row)
+        return self
+
+    def execute(self):
+        if self._update is not None:
+            self.parent.updates.append(self._update)
+            return SimpleNamespace(data=[])
+        if self.parent.inserts:
+            return SimpleNamespace(data=[{"id": "new-status"}])
+        return SimpleNamespace(data=self.parent.scheduled)
+
+
+class _FakeSupabase:
+    def __init__(self, scheduled):
+        self.scheduled = scheduled
+        self.updates = []
+        self.inserts = []
+
+    def table(self, _name):
+        return _FakeStatusTable(self)
+
+
+class TestClaimAlgorithmStatus(unittest.TestCase):
+    def test_scheduled_row_gets_run_id_in_the_running_update(self):
+        sb = _FakeSupabase([{"id": "sched-1", "run_id": None}])
+
+        status_id, run_id = algorithmStatus.claim_algorithm_status(sb, "pickup_matching", "All")
+
+        self.assertEqual(status_id, "sched-1")
+        self.assertTrue(run_id)
+        self.assertEqual(len(sb.updates), 1)
+        self.assertEqual(sb.updates[0]["status"], "running")
+        self.assertEqual(sb.updates[0]["run_id"], run_id)
+
+    def test_existing_run_id_is_kept(self):
+        sb = _FakeSupabase([{"id": "sched-1", "run_id": "run-7"}])
+
+        _, run_id = algorithmStatus.claim_algorithm_status(sb, "pickup_matching", "All")
+
+        self.assertEqual(run_id, "run-7")
+        self.assertNotIn("run_id", sb.updates[0])
+
+    def test_new_row_returns_the_inserted_run_id(self):
+        sb = _FakeSupabase([])
+
+        status_id, run_id = algorithmStatus.claim_algorithm_status(sb, "pickup_matching", "All")
+
+        self.assertEqual(status_id, "new-status")
+        self.assertEqual(run_id, sb.inserts[0]["run_id"])
+
+    def test_get_or_create_leaves_scheduled_run_id_unset(self):
+        sb = _FakeSupabase([{"id": "sched-1", "run_id": None}])
+
+        status_id = algorithmStatus.get_or_create_algorithm_status(sb, "pickup_matching", "All")
+
+        self.assertEqual(status_id, "sched-1")
+        self.assertNotIn("run_id", sb.updates[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
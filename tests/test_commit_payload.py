@@ -83,11 +83,31 @@ class TestBuildMatchingCommitPayload(unittest.TestCase):
         a = make_rider(1, date="2026-05-12", earliest_time="23:00:00", latest_time="02:00:00")
         b = make_rider(2, date="2026-05-12", earliest_time="23:30:00", latest_time="01:00:00")
 
-        earliest_time, latest_time = commit_payload.compute_group_time_window([a, b])
+        match = Match(riders=[a, b], suggested_time_iso="", terminal="1")
+
+        [(_, _, earliest_time, latest_time)] = commit_payload.compute_group_datetimes([match])
 
         self.assertEqual(earliest_time, "23:30:00")
         self.assertEqual(latest_time, "01:00:00")
 
+    def test_group_datetimes_fall_back_to_window_start_without_suggested_time(self):
+        riders = [
+            make_rider(1, date="2026-05-12", earliest_time="23:00:00", latest_time="02:00:00"),
+            make_rider(2, date="2026-05-12", earliest_time="23:30:00", latest_time="01:00:00"),
+        ]
+        suggested = Match(riders=riders, suggested_time_iso="2026-05-13T00:45:00", terminal="1")
+        unsuggested = Match(riders=riders, suggested_time_iso="", terminal="1")
+
+        result = commit_payload.compute_group_datetimes([suggested, unsuggested])
+
+        self.assertEqual(
+            result,
+            [
+                ("2026-05-13", "00:45:00", "23:30:00", "01:00:00"),
+                ("2026-05-12", "23:30:00", "23:30:00", "01:00:00"),
+            ],
+        )
+
     def test_payload_members_use_cross_midnight_group_window(self):
         with patch_config(COVERED_DATES_EXPLICIT=False):
             riders = [
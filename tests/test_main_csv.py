@@ -48,6 +48,31 @@ class TestWriteMatchesCsv(unittest.TestCase):
         self.assertEqual(rows[0]["earliest_time"], "23:55:00")
         self.assertEqual(rows[0]["latest_time"], "00:20:00")
 
+    def test_rows_sorted_by_date_and_time_with_renumbered_ids(self):
+        main = _load_main_module()
+        early = [make_rider(1, date="2026-05-12"), make_rider(2, date="2026-05-12")]
+        late = [make_rider(3, date="2026-05-12"), make_rider(4, date="2026-05-12")]
+        matches = [
+            Match(riders=late, suggested_time_iso="2026-05-12T11:45:00", terminal="1", bucket_key="TO LAX | POMONA"),
+            Match(riders=early, suggested_time_iso="2026-05-12T10:30:00", terminal="1", bucket_key="TO LAX | POMONA"),
+        ]
+
+        with tempfile.TemporaryDirectory() as tmp:
+            csv_path = Path(tmp) / "matches.csv"
+
+            main._write_matches_csv(matches, early + late, str(csv_path))
+
+            with csv_path.open() as handle:
+                reader = csv.DictReader(handle)
+                header = reader.fieldnames
+                rows = list(reader)
+
+        self.assertEqual(tuple(header), main.MATCHES_CSV_FIELDS)
+        self.assertEqual([row["ride_id_simulated"] for row in rows], ["1", "2"])
+        self.assertEqual([row["suggested_time"] for row in rows], ["10:30:00", "11:45:00"])
+        self.assertEqual(rows[0]["voucher"], "")
+        self.assertEqual(rows[0]["contingency_vouchers"], "[null, null]")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,8 +1,12 @@
 """Tests for normalization helpers in rider_data.py."""
 
 import unittest
+from types import SimpleNamespace
+from unittest import mock
 
-from rider_data import normalize_airport, normalize_matching_status, normalize_terminal
+import rider_data
+from rider_data import RiderData, normalize_airport, normalize_matching_status, normalize_terminal
+from tests.helpers import make_rider
 
 
 class TestNormalizeTerminal(unittest.TestCase):
@@ -45,5 +49,118 @@ class TestNormalizeMatchingStatus(unittest.TestCase):
         self.assertEqual(normalize_matching_status("pending"), "submitted")
 
 
+class TestRiderLite(unittest.TestCase):
+    def test_pipeline_fields_default_and_do_not_affect_equality(self):
+        a = make_rider(1)
+        b = make_rider(1)
+        b.source_ride_id = 42
+        b.contingency_voucher = "CONT-1"
+
+        self.assertIsNone(a.source_ride_id)
+        self.assertIsNone(a.group_voucher)
+        self.assertEqual(a, b)
+
+    def test_unknown_attributes_are_rejected(self):
+        rider = make_rider(1)
+        with self.assertRaises(AttributeError):
+            rider.not_a_field = True
+
+
+class _FakeUsersTable:
+    def __init__(self, rows):
+        self.rows = rows
+        self.requested = []
+
+    def select(self, _columns):
+        return self
+
+    def in_(self, _column, values):
+        self.requested.append(list(values))
+        self._values = set(values)
+        return self
+
+    def execute(self):
+        return SimpleNamespace(data=[r for r in self.rows if r["user_id"] in self._values])
+
+
+class _FakeUsersClient:
+    def __init__(self, table):
+        self._table = table
+
+    def table(self, _name):
+        return self._table
+
+
+class TestFetchUsers(unittest.TestCase):
+    def test_user_ids_are_queried_in_chunks(self):
+        user_ids = [f"user-{i:03d}" for i in range(rider_data.IN_FILTER_CHUNK_SIZE * 2 + 5)]
+        users = _FakeUsersTable([
+            {"user_id": uid, "school": "POMONA", "firstname": "F", "lastname": uid}
+            for uid in user_ids
+        ])
+
+        result = RiderData(_FakeUsersClient(users)).fetch_users(user_ids + user_ids[:3])
+
+        self.assertEqual(
+            [len(chunk) for chunk in users.requested],
+            [rider_data.IN_FILTER_CHUNK_SIZE, rider_data.IN_FILTER_CHUNK_SIZE, 5],
+        )
+        self.assertEqual(sorted(result), user_ids)
+
+
+class _FakeFlightsQuery:
+    def __init__(self, table):
+        self.table = table
+
+    def select(self, _columns):
+        return self
+
+    def order(self, _column, desc=False):
+        return self
+
+    def gt(self, _column, _value):
+        return self
+
+    def gte(self, _column, _value):
+        return self
+
+    def lte(self, _column, _value):
+        return self
+
+    def range(self, start, end):
+        self.table.ranges.append((start, end))
+        self._rows = self.table.rows[start:end + 1]
+        return self
+
+    def execute(self):
+        return SimpleNamespace(data=self._rows)
+
+
+class _FakeFlightsClient:
+    def __init__(self, rows):
+        self.rows = rows
+        self.ranges = []
+
+    def table(self, _name):
+        return _FakeFlightsQuery(self)
+
+
+class TestFetchFlightsPaging(unittest.TestCase):
+    def test_reads_every_page_and_skips_matched_flights(self):
+        rows = [
+            {"flight_id": 1, "matching_status": "submitted"},
+            {"flight_id": 2, "matching_status": "matched"},
+            {"flight_id": 3, "matching_status": None},
+            {"flight_id": 4, "matching_status": "unmatched"},
+            {"flight_id": 5, "matching_status": "submitted"},
+        ]
+        client = _FakeFlightsClient(rows)
+
+        with mock.patch.object(rider_data, "FLIGHTS_PAGE_SIZE", 2):
+            flights = RiderData(client).fetch_flights()
+
+        self.assertEqual([f["flight_id"] for f in flights], [1, 3, 4, 5])
+        self.assertEqual(client.ranges, [(0, 1), (2, 3), (4, 5)])
+
 if __name__ == "__main__":
     unittest.main()
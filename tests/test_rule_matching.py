@@ -40,6 +40,40 @@ class TestEffectiveOverlap(unittest.TestCase):
             self.assertEqual(rm._effective_overlap_minutes([a, b]), -1)
 
 
+class TestBuildScoredPairs(unittest.TestCase):
+    def test_keeps_touching_pairs_and_drops_disjoint_windows(self):
+        a = make_rider(1, earliest_time="10:00:00", latest_time="12:00:00")
+        b = make_rider(2, earliest_time="12:05:00", latest_time="13:00:00")
+        c = make_rider(3, earliest_time="16:00:00", latest_time="17:00:00")
+        with patch_config(ALLOW_TOUCHING=True, OVERLAP_GRACE_MIN=10):
+            pairs = rm._build_scored_pairs([a, b, c])
+        self.assertEqual([(i, j) for i, j, _ in pairs], [(0, 1)])
+
+    def test_strict_terminals_only_pair_within_a_terminal(self):
+        riders = [make_rider(1, terminal="1"), make_rider(2, terminal="2"), make_rider(3, terminal="1")]
+        with patch_config(TERMINAL_MODE="strict"):
+            pairs = rm._build_scored_pairs(riders)
+        self.assertEqual([(i, j) for i, j, _ in pairs], [(0, 2)])
+
+    def test_touching_pair_dropped_without_grace(self):
+        a = make_rider(1, earliest_time="10:00:00", latest_time="12:00:00")
+        b = make_rider(2, earliest_time="12:05:00", latest_time="13:00:00")
+        with patch_config(ALLOW_TOUCHING=False):
+            self.assertEqual(rm._build_scored_pairs([a, b]), [])
+
+
+class TestExpandGroup(unittest.TestCase):
+    def test_adds_only_candidates_inside_the_group_window(self):
+        a = make_rider(1, earliest_time="10:00:00", latest_time="12:00:00", bags_no=0)
+        b = make_rider(2, earliest_time="10:30:00", latest_time="12:00:00", bags_no=0)
+        fits = make_rider(3, earliest_time="11:00:00", latest_time="13:00:00", bags_no=0)
+        late = make_rider(4, earliest_time="15:00:00", latest_time="16:00:00", bags_no=0)
+
+        group = rm._expand_group([a, b], [a, b, late, fits])
+
+        self.assertEqual([r.flight_id for r in group], [1, 2, 3])
+
+
 class TestIsValidGroup(unittest.TestCase):
     def test_valid_pair(self):
         a = make_rider(1, earliest_time="10:00:00", latest_time="12:00:00", bags_no=1)
@@ -149,6 +183,62 @@ class TestMatchBucket(unittest.TestCase):
         self.assertEqual(diag[a.flight_id]["reason"], "singleton_bucket")
 
 
+class TestPromoteLaxTwos(unittest.TestCase):
+    def test_two_group_steals_one_rider_from_donor(self):
+        riders = [make_rider(i, bags_no=0) for i in range(1, 7)]
+        two = rm._group_to_match(riders[:2], bucket_key="TO LAX | POMONA")
+        donor = rm._group_to_match(riders[2:], bucket_key="TO LAX | POMONA")
+
+        result = rm._promote_lax_twos([two, donor], "TO LAX | POMONA")
+
+        self.assertEqual(sorted(len(m.riders) for m in result), [3, 3])
+        self.assertEqual(
+            sorted(r.flight_id for m in result for r in m.riders), [1, 2, 3, 4, 5, 6]
+        )
+
+    def test_skips_donor_rider_already_in_another_match(self):
+        riders = [make_rider(i, bags_no=0) for i in range(1, 6)]
+        two = rm._group_to_match(riders[:2], bucket_key="TO LAX | POMONA")
+        donor = rm._group_to_match(riders[2:5], bucket_key="TO LAX | POMONA")
+        # flight 3 also sits in a third (duplicate) group, so it must not move
+        duplicate = rm._group_to_match([make_rider(3, bags_no=0), make_rider(9, bags_no=0)], bucket_key="TO LAX | POMONA")
+
+        rm._promote_lax_twos([two, donor, duplicate], "TO LAX | POMONA")
+
+        self.assertNotIn(3, {r.flight_id for r in two.riders})
+        self.assertIn(3, {r.flight_id for r in donor.riders})
+
+
+class TestFormConnectShuttleGroups(unittest.TestCase):
+    def test_fills_larger_tier_first_and_returns_leftovers(self):
+        pool = [make_rider(i) for i in range(1, 30)]
+        with patch_config(CONNECT_SIZE1=[6, 12], CONNECT_SIZE2=[12, 24]):
+            matches, remaining = rm._form_connect_shuttle_groups(pool, "TO LAX | POMONA")
+
+        self.assertEqual([len(m.riders) for m in matches], [24])
+        self.assertTrue(all(m.ride_type == "Connect" for m in matches))
+        self.assertEqual(remaining, pool[24:])
+
+    def test_splits_pool_in_order_across_groups(self):
+        pool = [make_rider(i) for i in range(1, 16)]
+        with patch_config(CONNECT_SIZE1=[3, 6], CONNECT_SIZE2=[]):
+            matches, remaining = rm._form_connect_shuttle_groups(pool, "TO LAX | POMONA")
+
+        self.assertEqual(
+            [[r.flight_id for r in m.riders] for m in matches],
+            [list(range(1, 7)), list(range(7, 13)), [13, 14, 15]],
+        )
+        self.assertEqual(remaining, [])
+
+    def test_short_pool_is_returned_untouched(self):
+        pool = [make_rider(i) for i in range(1, 3)]
+        with patch_config(CONNECT_SIZE1=[3, 6], CONNECT_SIZE2=[]):
+            matches, remaining = rm._form_connect_shuttle_groups(pool, "TO LAX | POMONA")
+
+        self.assertEqual(matches, [])
+        self.assertEqual(remaining, pool)
+
+
 class TestOntPostProcess(unittest.TestCase):
     def test_noop_when_no_unmatched(self):
         matches, unmatched = rm._ont_post_process_unmatched([], [])
@@ -160,6 +250,18 @@ class TestOntPostProcess(unittest.TestCase):
         matches, unmatched = rm._ont_post_process_unmatched([], [lax_rider])
         self.assertEqual(unmatched, [lax_rider])
 
+    def test_splits_four_in_place_to_pair_an_unmatched_rider(self):
+        other = rm._group_to_match([make_rider(i, airport="ONT", bags_no=0) for i in (10, 11)])
+        four = rm._group_to_match([make_rider(i, airport="ONT", bags_no=0) for i in range(1, 5)])
+        lone = make_rider(9, airport="ONT", bags_no=0)
+
+        matches, unmatched = rm._ont_post_process_unmatched([other, four], [lone])
+
+        self.assertEqual(unmatched, [])
+        self.assertIs(matches[0], other)
+        self.assertEqual(len(matches[1].riders), 3)
+        self.assertEqual(sorted(r.flight_id for r in matches[2].riders)[-1], 9)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -63,6 +63,22 @@ class TestCommitRpcSqlContract(unittest.TestCase):
             self.normalized_sql,
         )
 
+    def test_rpc_inserts_each_group_with_one_matches_statement(self):
+        self.assertRegex(
+            self.normalized_sql,
+            r'insert into public\."matches" \([^)]*\) select v_ride_id, .*? '
+            r"from jsonb_array_elements\(group_item->'members'\) as members\(member_item\);",
+        )
+        self.assertNotIn("for member_item in", self.normalized_sql)
+
+    def test_rpc_marks_matched_flights_with_one_bulk_update(self):
+        self.assertIn(
+            "into v_matched_flight_ids from jsonb_array_elements(coalesce(p_payload->'groups', '[]'::jsonb))",
+            self.normalized_sql,
+        )
+        self.assertIn("where flight_id = any(v_matched_flight_ids);", self.normalized_sql)
+        self.assertNotIn("array_append(v_matched_flight_ids", self.normalized_sql)
+
     def test_rpc_keeps_run_ledger_and_transactional_write_set(self):
         for required_fragment in (
             'insert into public."matchingruns"',